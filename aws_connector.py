@@ -9,7 +9,9 @@ Copied from working WAF Scanner application
 import streamlit as st
 from typing import Optional, Tuple, Dict, List
 from dataclasses import dataclass
+from types import SimpleNamespace
 import os
+import hashlib
 import logging
 
 logger = logging.getLogger(__name__)
@@ -363,21 +365,74 @@ def test_aws_connection(_session) -> Tuple[bool, str, Dict]:
         return False, str(e), {}
 
 
+# Optional: let botocore decode JSON responses (large payloads such as Cost
+# Explorer ResultsByTime) with orjson (pip install orjson). This is a
+# process-wide side effect on every boto3 client, so it lives here next to
+# client creation. Only botocore's own reference to the json module is
+# swapped - the stdlib module is untouched for everything else. botocore
+# calls nothing but loads(str) and catches ValueError, which orjson's
+# JSONDecodeError subclasses.
+try:
+    import orjson
+    import botocore.parsers
+    botocore.parsers.json = SimpleNamespace(loads=orjson.loads)
+except ImportError:
+    pass
+
+
+def _session_identity(session) -> str:
+    """
+    Stable identity for a boto3 session.
+    get_aws_session() builds a fresh Session object on each call, so id() is
+    useless as a cache key. The cache is shared by every user of the process,
+    so key on a hash of the full credential set (access key, secret and
+    session token) - never on the access key alone - plus the region.
+    """
+    credentials = session.get_credentials()
+    if credentials is None:
+        return f"anonymous:{session.region_name}"
+    frozen = credentials.get_frozen_credentials()
+    digest = hashlib.sha256(
+        "\0".join((frozen.access_key, frozen.secret_key, frozen.token or "")).encode()
+    ).hexdigest()
+    return f"{digest}:{session.region_name}"
+
+
+# Clients are keyed by credential hash; the TTL drops clients built from
+# expired STS credentials and max_entries bounds the process-wide cache.
+@st.cache_resource(show_spinner=False, ttl=3600, max_entries=256)
+def _cached_client(service_name: str, session_id: str, region_name: Optional[str], _session):
+    """Create one boto3 client per (service, credentials, region) and reuse it across reruns"""
+    from botocore.config import Config
+    # Shared clients serve concurrent fetches: widen the connection pool past
+    # urllib3's default of 10, keep connections alive, and back off adaptively
+    # when AWS throttles instead of failing the call.
+    config = Config(
+        max_pool_connections=25,
+        retries={'mode': 'adaptive', 'max_attempts': 10},
+        tcp_keepalive=True,
+        connect_timeout=10,
+        read_timeout=30
+    )
+    if region_name:
+        return _session.client(service_name, region_name=region_name, config=config)
+    return _session.client(service_name, config=config)
+
+
 def get_aws_client(service_name: str, session=None, region_name: str = None):
     """
     Get an AWS client for a specific service.
     Uses the session from get_aws_session() if not provided.
+    Clients are cached per credentials so service models are only loaded once.
     """
     if session is None:
         session = get_aws_session()
-    
+
     if session is None:
         return None
-    
+
     try:
-        if region_name:
-            return session.client(service_name, region_name=region_name)
-        return session.client(service_name)
+        return _cached_client(service_name, _session_identity(session), region_name, session)
     except Exception as e:
         logger.error(f"Failed to create {service_name} client: {e}")
         return None
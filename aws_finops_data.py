@@ -18,6 +18,7 @@ Version: 1.1.0 (2024-12-25)
 
 import streamlit as st
 import boto3
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 import pandas as pd
@@ -86,7 +87,7 @@ def fetch_cost_overview(days: int = 30) -> Optional[Dict[str, Any]]:
         
         # Process results
         daily_costs = []
-        service_costs = {}
+        service_costs = defaultdict(float)
         total_cost = 0
         
         for result in response.get('ResultsByTime', []):
@@ -97,7 +98,7 @@ def fetch_cost_overview(days: int = 30) -> Optional[Dict[str, Any]]:
                 service = group['Keys'][0]
                 cost = float(group['Metrics']['BlendedCost']['Amount'])
                 day_total += cost
-                service_costs[service] = service_costs.get(service, 0) + cost
+                service_costs[service] += cost
             
             daily_costs.append({'date': date, 'cost': day_total})
             total_cost += day_total
@@ -110,12 +111,12 @@ def fetch_cost_overview(days: int = 30) -> Optional[Dict[str, Any]]:
             GroupBy=[{'Type': 'DIMENSION', 'Key': 'LINKED_ACCOUNT'}]
         )
         
-        account_costs = {}
+        account_costs = defaultdict(float)
         for result in account_response.get('ResultsByTime', []):
             for group in result.get('Groups', []):
                 account_id = group['Keys'][0]
                 cost = float(group['Metrics']['BlendedCost']['Amount'])
-                account_costs[account_id] = account_costs.get(account_id, 0) + cost
+                account_costs[account_id] += cost
         
         # Sort services by cost
         sorted_services = sorted(service_costs.items(), key=lambda x: x[1], reverse=True)
@@ -124,7 +125,7 @@ def fetch_cost_overview(days: int = 30) -> Optional[Dict[str, Any]]:
             'total_cost': total_cost,
             'daily_costs': daily_costs,
             'service_costs': dict(sorted_services[:15]),
-            'account_costs': account_costs,
+            'account_costs': dict(account_costs),
             'period_days': days,
             'start_date': start_date,
             'end_date': end_date
@@ -179,7 +180,7 @@ def fetch_aiml_costs(days: int = 30) -> Optional[Dict[str, Any]]:
         )
         
         daily_costs = []
-        service_costs = {}
+        service_costs = defaultdict(float)
         total_cost = 0
         
         for result in response.get('ResultsByTime', []):
@@ -190,7 +191,7 @@ def fetch_aiml_costs(days: int = 30) -> Optional[Dict[str, Any]]:
                 service = group['Keys'][0].replace('Amazon ', '').replace('AWS ', '')
                 cost = float(group['Metrics']['BlendedCost']['Amount'])
                 day_total += cost
-                service_costs[service] = service_costs.get(service, 0) + cost
+                service_costs[service] += cost
             
             daily_costs.append({'date': date, 'cost': day_total})
             total_cost += day_total
@@ -215,7 +216,7 @@ def fetch_aiml_costs(days: int = 30) -> Optional[Dict[str, Any]]:
         return {
             'total_cost': total_cost,
             'daily_costs': daily_costs,
-            'service_costs': service_costs,
+            'service_costs': dict(service_costs),
             'gpu_cost': gpu_cost,
             'period_days': days
         }
@@ -225,7 +226,7 @@ def fetch_aiml_costs(days: int = 30) -> Optional[Dict[str, Any]]:
         return {
             'total_cost': total_cost if 'total_cost' in locals() else 0,
             'daily_costs': daily_costs if 'daily_costs' in locals() else [],
-            'service_costs': service_costs if 'service_costs' in locals() else {},
+            'service_costs': dict(service_costs) if 'service_costs' in locals() else {},
             'gpu_cost': 0,
             'period_days': days,
             'error': str(e)
@@ -421,8 +422,8 @@ def fetch_cost_by_account(days: int = 30) -> Optional[Dict[str, Any]]:
             ]
         )
         
-        account_costs = {}
-        account_services = {}
+        account_costs = defaultdict(float)
+        account_services = defaultdict(lambda: defaultdict(float))
         
         for result in response.get('ResultsByTime', []):
             for group in result.get('Groups', []):
@@ -430,11 +431,8 @@ def fetch_cost_by_account(days: int = 30) -> Optional[Dict[str, Any]]:
                 service = group['Keys'][1]
                 cost = float(group['Metrics']['BlendedCost']['Amount'])
                 
-                account_costs[account_id] = account_costs.get(account_id, 0) + cost
-                
-                if account_id not in account_services:
-                    account_services[account_id] = {}
-                account_services[account_id][service] = account_services[account_id].get(service, 0) + cost
+                account_costs[account_id] += cost
+                account_services[account_id][service] += cost
         
         # Try to get account names from Organizations
         account_names = {}
@@ -449,8 +447,8 @@ def fetch_cost_by_account(days: int = 30) -> Optional[Dict[str, Any]]:
             pass
         
         return {
-            'account_costs': account_costs,
-            'account_services': account_services,
+            'account_costs': dict(account_costs),
+            'account_services': {account_id: dict(services) for account_id, services in account_services.items()},
             'account_names': account_names,
             'total_cost': sum(account_costs.values())
         }
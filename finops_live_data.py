@@ -10,10 +10,19 @@ Version: 1.1.0
 """
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from botocore.exceptions import ClientError
+import calendar
+import heapq
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from operator import itemgetter
+from typing import Callable, Dict, List, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
 
 # Import working client getters from aws_finops_data
 try:
@@ -38,6 +47,9 @@ except ImportError:
         return start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
 
 
+MONTH_ABBR = {month: calendar.month_abbr[month] for month in range(1, 13)}
+
+
 def is_live_mode() -> bool:
     """Check if we're in live mode with valid AWS connection"""
     if st.session_state.get('demo_mode', False):
@@ -54,105 +66,279 @@ def is_live_mode() -> bool:
     return False
 
 
+def _fetch_concurrently(fetches: Dict[str, Callable[[], Any]], max_workers: int = 5,
+                        return_exceptions: bool = False) -> Dict[str, Any]:
+    """
+    Run independent AWS fetches in parallel and return their results by key.
+    boto3 releases the GIL while waiting on the network, so wall time becomes
+    the slowest call instead of the sum.
+    
+    Workers inherit the script run context so they can read session state,
+    but not the fragment or container they were started from - they must not
+    emit elements. A failed fetch re-raises on the calling thread, or with
+    return_exceptions its exception is returned as the result, so the
+    caller can report it in place.
+    """
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(fetches)),
+                            initializer=lambda: add_script_run_ctx(ctx=ctx)) as executor:
+        futures = {key: executor.submit(fetch) for key, fetch in fetches.items()}
+        if not return_exceptions:
+            return {key: future.result() for key, future in futures.items()}
+        return {key: future.exception() or future.result() for key, future in futures.items()}
+
+
+# Cost Explorer bills $0.01 per request. Count real (uncached) requests per
+# session and stop issuing new ones past a soft monthly cap.
+CE_SOFT_CALL_CAP = 500
+
+_ce_call_lock = threading.Lock()
+
+
+class CostExplorerCallCapReached(Exception):
+    """Raised instead of calling Cost Explorer once the session's soft cap is reached"""
+
+
+class ComputeOptimizerFetchFailed(Exception):
+    """
+    Raised when a Compute Optimizer call fails transiently. Carries whatever
+    the other call returned so it can still be shown, uncached.
+    """
+    def __init__(self, error: Exception, recommendations: List[Dict]):
+        super().__init__(str(error))
+        self.recommendations = recommendations
+
+
+def _record_ce_call():
+    """Count one billed Cost Explorer request, refusing it once the soft cap is reached"""
+    month = datetime.now().strftime('%Y-%m')
+    # Concurrent fetches update the same counters
+    with _ce_call_lock:
+        if st.session_state.get('ce_call_month') != month:
+            st.session_state['ce_call_month'] = month
+            st.session_state['ce_call_count'] = 0
+        if st.session_state['ce_call_count'] >= CE_SOFT_CALL_CAP:
+            raise CostExplorerCallCapReached(
+                f"Cost Explorer soft cap of {CE_SOFT_CALL_CAP} requests reached this month"
+            )
+        st.session_state['ce_call_count'] += 1
+        st.session_state['ce_last_fetch'] = datetime.now()
+
+
+def _billed(operation):
+    """Wrap a Cost Explorer operation so every request goes through _record_ce_call"""
+    def call(**kwargs):
+        _record_ce_call()
+        return operation(**kwargs)
+    return call
+
+
+def _account_scope() -> Optional[str]:
+    """
+    Cache key for the connected account so cached AWS data is never shared
+    across accounts. None when the account id could not be resolved.
+    """
+    account_id = st.session_state.get('aws_account_id')
+    if not account_id or account_id == 'Unknown':
+        return None
+    return str(account_id)
+
+
+def _scoped_fetch(cached_fetch, client, *args):
+    """
+    Call a cached fetch helper as cached_fetch(client, account_id, *args).
+    The cache is shared by every session in the process, so without a
+    resolved account id nothing keeps accounts apart - call the undecorated
+    function instead of reading or populating the cache.
+    """
+    account_id = _account_scope()
+    if account_id is None:
+        return cached_fetch.__wrapped__(client, '', *args)
+    return cached_fetch(client, account_id, *args)
+
+
+def _cache_day() -> str:
+    """
+    Day bucket for disk-persisted caches. Slow-moving data (monthly trend,
+    rightsizing) survives app restarts via persist="disk", but persistent
+    caches ignore TTL, so the date in the key gives them a one-day max age.
+    """
+    return datetime.now().strftime('%Y-%m-%d')
+
+
 # ============================================================================
 # COST DATA FUNCTIONS - Using same pattern as working aws_finops_data.py
 # ============================================================================
+# Clients live in session state, so each fetch resolves its client and passes
+# it (unhashed, underscore-prefixed) to a cached helper keyed on account id.
 
 def fetch_real_cost_data(days: int = 30) -> Optional[Dict]:
     """Fetch cost data using the same pattern as aws_finops_data.py"""
-    ce_client = get_ce_client()
-    if not ce_client:
-        return None
-    
     try:
-        start_date, end_date = get_date_range(days)
-        
-        response = ce_client.get_cost_and_usage(
-            TimePeriod={'Start': start_date, 'End': end_date},
-            Granularity='DAILY',
-            Metrics=['BlendedCost', 'UnblendedCost'],
-            GroupBy=[{'Type': 'DIMENSION', 'Key': 'SERVICE'}]
-        )
-        
-        total_cost = 0
-        service_costs = {}
-        daily_costs = []
-        
-        for result in response.get('ResultsByTime', []):
-            date = result['TimePeriod']['Start']
-            day_total = 0
-            
-            for group in result.get('Groups', []):
-                service = group['Keys'][0]
-                cost = float(group['Metrics']['BlendedCost']['Amount'])
-                service_costs[service] = service_costs.get(service, 0) + cost
-                day_total += cost
-                total_cost += cost
-            
-            daily_costs.append({'date': date, 'cost': day_total})
-        
-        return {
-            'total_cost': total_cost,
-            'service_costs': service_costs,
-            'daily_costs': daily_costs,
-            'period_days': days,
-            'source': 'AWS Cost Explorer'
-        }
-        
+        return _load_cost_data(days)
     except Exception as e:
         st.warning(f"Cost data: {e}")
         return None
 
 
-def fetch_monthly_costs(months: int = 6) -> Optional[List[Dict]]:
-    """Fetch monthly cost breakdown"""
+def _load_cost_data(days: int) -> Optional[Dict]:
+    """fetch_real_cost_data without the warning - raises, so worker threads can run it"""
     ce_client = get_ce_client()
     if not ce_client:
         return None
-    
     try:
-        end_date = datetime.now().replace(day=1)
-        start_date = (end_date - timedelta(days=months * 31)).replace(day=1)
-        
-        response = ce_client.get_cost_and_usage(
-            TimePeriod={
-                'Start': start_date.strftime('%Y-%m-%d'),
-                'End': end_date.strftime('%Y-%m-%d')
-            },
+        return _scoped_fetch(_fetch_real_cost_data, ce_client, days)
+    except CostExplorerCallCapReached:
+        return None
+
+
+@st.cache_data(ttl=900, max_entries=32, show_spinner=False)  # Cache for 15 minutes
+def _fetch_real_cost_data(_ce_client, account_id: str, days: int) -> Dict:
+    # Errors propagate to the caller - Streamlit doesn't cache an
+    # exception, so one throttled call isn't replayed for 15 minutes
+    start_date, end_date = get_date_range(days)
+    time_period = {'Start': start_date, 'End': end_date}
+    
+    # The trend only needs daily totals and the breakdown only needs
+    # per-service totals, so query those two shapes (in parallel) instead
+    # of a DAILY x SERVICE grid that is ~30x larger to download and parse
+    results = _fetch_concurrently({
+        'daily': lambda: _daily_cost_totals(_ce_client, time_period),
+        'services': lambda: _service_cost_totals(_ce_client, time_period),
+    })
+    daily_totals = results['daily']
+    service_costs = results['services']
+    
+    return {
+        'total_cost': float(daily_totals.sum()),
+        'service_costs': service_costs.to_dict(),
+        # Parallel arrays rather than per-day dicts; plotly accepts these directly
+        'daily_dates': daily_totals.index.to_numpy(dtype='datetime64[D]'),
+        'daily_costs': daily_totals.to_numpy(dtype=np.float64),
+        'period_days': days,
+        'source': 'AWS Cost Explorer'
+    }
+
+
+def _daily_cost_totals(ce_client, time_period: Dict) -> pd.Series:
+    """Ungrouped cost per day, indexed by ISO date"""
+    totals = {}
+    for page in _iter_pages(
+        _billed(ce_client.get_cost_and_usage), 'NextPageToken',
+        TimePeriod=time_period,
+        Granularity='DAILY',
+        Metrics=['BlendedCost']
+    ):
+        for result in page.get('ResultsByTime', []):
+            totals[result['TimePeriod']['Start']] = float(
+                result.get('Total', {}).get('BlendedCost', {}).get('Amount', 0)
+            )
+    return pd.Series(totals, dtype=np.float64)
+
+
+def _service_cost_totals(ce_client, time_period: Dict) -> pd.Series:
+    """Cost per service over the period (one or two monthly buckets summed)"""
+    rows = [
+        (group['Keys'][0], float(group['Metrics']['BlendedCost']['Amount']))
+        for page in _iter_pages(
+            _billed(ce_client.get_cost_and_usage), 'NextPageToken',
+            TimePeriod=time_period,
             Granularity='MONTHLY',
-            Metrics=['BlendedCost']
+            Metrics=['BlendedCost'],
+            GroupBy=[{'Type': 'DIMENSION', 'Key': 'SERVICE'}]
         )
-        
-        monthly_costs = []
-        for result in response.get('ResultsByTime', []):
-            month_start = result['TimePeriod']['Start']
-            cost = float(result.get('Total', {}).get('BlendedCost', {}).get('Amount', 0))
-            month_date = datetime.strptime(month_start, '%Y-%m-%d')
-            
-            monthly_costs.append({
-                'month': month_date.strftime('%b'),
-                'date': month_start,
-                'cost': cost
-            })
-        
-        return monthly_costs
-        
+        for result in page.get('ResultsByTime', [])
+        for group in result.get('Groups', [])
+    ]
+    df = pd.DataFrame.from_records(rows, columns=['service', 'cost'])
+    return df.groupby('service', sort=False)['cost'].sum()
+
+
+def _iter_pages(operation, token_key: str, **kwargs):
+    """
+    Yield every response page of an AWS call that boto3 has no paginator for
+    (Cost Explorer GetCostAndUsage, Compute Optimizer recommendations).
+    token_key is the call's continuation token, e.g. 'NextPageToken'.
+    """
+    while True:
+        response = operation(**kwargs)
+        yield response
+        next_token = response.get(token_key)
+        if not next_token:
+            return
+        kwargs[token_key] = next_token
+
+
+def fetch_monthly_costs(months: int = 6) -> Optional[List[Dict]]:
+    """Fetch monthly cost breakdown"""
+    try:
+        return _load_monthly_costs(months)
     except Exception as e:
         st.warning(f"Monthly costs: {e}")
         return None
 
 
+def _load_monthly_costs(months: int) -> Optional[List[Dict]]:
+    """fetch_monthly_costs without the warning - raises, so worker threads can run it"""
+    ce_client = get_ce_client()
+    if not ce_client:
+        return None
+    try:
+        return _scoped_fetch(_fetch_monthly_costs, ce_client, months, _cache_day())
+    except CostExplorerCallCapReached:
+        return None
+
+
+@st.cache_data(persist="disk", max_entries=32, show_spinner=False)  # Persisted, refreshed daily
+def _fetch_monthly_costs(_ce_client, account_id: str, months: int, as_of: str) -> List[Dict]:
+    # Errors propagate to the caller: a returned None would be
+    # persisted and hide the trend for the rest of the day
+    end_date = datetime.now().replace(day=1)
+    start_date = (end_date - timedelta(days=months * 31)).replace(day=1)
+    
+    response = _billed(_ce_client.get_cost_and_usage)(
+        TimePeriod={
+            'Start': start_date.strftime('%Y-%m-%d'),
+            'End': end_date.strftime('%Y-%m-%d')
+        },
+        Granularity='MONTHLY',
+        Metrics=['BlendedCost']
+    )
+    
+    monthly_costs = []
+    for result in response.get('ResultsByTime', []):
+        month_start = result['TimePeriod']['Start']
+        cost = float(result.get('Total', {}).get('BlendedCost', {}).get('Amount', 0))
+        
+        monthly_costs.append({
+            # Cost Explorer dates are always ISO 'YYYY-MM-DD'
+            'month': MONTH_ABBR[int(month_start[5:7])],
+            'date': month_start,
+            'cost': cost
+        })
+    
+    return monthly_costs
+
+
 def fetch_real_forecast() -> Optional[Dict]:
     """Fetch cost forecast"""
     ce_client = get_ce_client()
     if not ce_client:
         return None
-    
+    try:
+        return _scoped_fetch(_fetch_real_forecast, ce_client)
+    except Exception:
+        # Includes CostExplorerCallCapReached; transient errors aren't cached
+        return None
+
+
+@st.cache_data(ttl=900, max_entries=32, show_spinner=False)  # Cache for 15 minutes
+def _fetch_real_forecast(_ce_client, account_id: str) -> Optional[Dict]:
     try:
         start_date = datetime.now() + timedelta(days=1)
         end_date = start_date + timedelta(days=30)
         
-        response = ce_client.get_cost_forecast(
+        response = _billed(_ce_client.get_cost_forecast)(
             TimePeriod={
                 'Start': start_date.strftime('%Y-%m-%d'),
                 'End': end_date.strftime('%Y-%m-%d')
@@ -170,11 +356,11 @@ def fetch_real_forecast() -> Optional[Dict]:
         }
         
     except ClientError as e:
+        # Not enough history is a stable answer worth caching; anything else
+        # propagates so it isn't cached
         if 'DataUnavailable' in str(e):
             return {'forecast_amount': None, 'error': 'Not enough historical data'}
-        return None
-    except Exception:
-        return None
+        raise
 
 
 def fetch_real_budgets() -> Optional[List[Dict]]:
@@ -190,15 +376,21 @@ def fetch_real_budgets() -> Optional[List[Dict]]:
         # Budgets not available - return None silently
         return None
     
+    account_id = st.session_state.get('aws_account_id')
+    if not account_id:
+        return None
+    return _fetch_real_budgets(budgets_client, account_id)
+
+
+@st.cache_data(ttl=900, max_entries=32, show_spinner=False)  # Cache for 15 minutes
+def _fetch_real_budgets(_budgets_client, account_id: str) -> Optional[List[Dict]]:
     try:
-        account_id = st.session_state.get('aws_account_id')
-        if not account_id:
-            return None
-        
-        response = budgets_client.describe_budgets(AccountId=account_id)
+        budgets_raw = []
+        for page in _budgets_client.get_paginator('describe_budgets').paginate(AccountId=account_id):
+            budgets_raw.extend(page.get('Budgets', []))
         
         budgets = []
-        for budget in response.get('Budgets', []):
+        for budget in budgets_raw:
             budget_limit = float(budget['BudgetLimit']['Amount'])
             actual_spend = float(budget.get('CalculatedSpend', {}).get('ActualSpend', {}).get('Amount', 0))
             forecasted_spend = float(budget.get('CalculatedSpend', {}).get('ForecastedSpend', {}).get('Amount', 0))
@@ -227,33 +419,79 @@ def fetch_real_recommendations() -> Optional[List[Dict]]:
     
     if not co:
         return None
+    try:
+        return _scoped_fetch(_fetch_real_recommendations, co, _cache_day())
+    except ComputeOptimizerFetchFailed as e:
+        st.warning(f"Recommendations may be incomplete: {e}")
+        return e.recommendations or None
+    except Exception as e:
+        st.warning(f"Recommendations: {e}")
+        return None
+
+
+@st.cache_data(persist="disk", max_entries=32, show_spinner=False)  # Persisted, refreshed daily
+def _fetch_real_recommendations(_co, account_id: str, as_of: str) -> Optional[List[Dict]]:
+    # EC2 and EBS recommendations are independent calls - fetch them in
+    # parallel. Each helper isolates its own failure, so both always finish.
+    results = _fetch_concurrently({
+        'ec2': lambda: _ec2_recommendations(_co),
+        'ebs': lambda: _ebs_recommendations(_co),
+    })
+    (ec2_recs, ec2_error), (ebs_recs, ebs_error) = results['ec2'], results['ebs']
+    recommendations = ec2_recs + ebs_recs
+    
+    # Raise (Streamlit never caches an exception) so a transient failure is
+    # not persisted as "no recommendations" for the rest of the day
+    if ec2_error or ebs_error:
+        raise ComputeOptimizerFetchFailed(ec2_error or ebs_error, recommendations)
     
+    return recommendations if recommendations else None
+
+
+# Errors that won't clear up on retry: the account isn't opted in to Compute
+# Optimizer, or the role can't read it. These are a stable "no
+# recommendations" answer and safe to cache.
+_CO_UNAVAILABLE_ERRORS = frozenset({'OptInRequiredException', 'AccessDeniedException'})
+
+
+def _transient_co_error(e: Exception) -> Optional[Exception]:
+    """The error to report for a failed Compute Optimizer call, or None when it is permanent"""
+    if isinstance(e, ClientError) and e.response.get('Error', {}).get('Code') in _CO_UNAVAILABLE_ERRORS:
+        return None
+    return e
+
+
+def _ec2_recommendations(co) -> Tuple[List[Dict], Optional[Exception]]:
+    """Non-optimized EC2 instances from Compute Optimizer, as (recommendations, error)"""
     recommendations = []
     
     try:
-        ec2_response = co.get_ec2_instance_recommendations()
-        
-        for rec in ec2_response.get('instanceRecommendations', []):
-            if rec.get('finding') != 'OPTIMIZED':
-                rec_options = rec.get('recommendationOptions', [])
-                if rec_options:
-                    recommendations.append({
-                        'type': 'EC2',
-                        'resource_id': rec.get('instanceArn', '').split('/')[-1],
-                        'finding': rec.get('finding'),
-                        'current': rec.get('currentInstanceType', 'Unknown'),
-                        'recommended': rec_options[0].get('instanceType', 'Unknown'),
-                        'category': 'Compute'
-                    })
-        
-    except Exception:
-        pass
+        for page in _iter_pages(co.get_ec2_instance_recommendations, 'nextToken'):
+            for rec in page.get('instanceRecommendations', []):
+                if rec.get('finding') != 'OPTIMIZED':
+                    rec_options = rec.get('recommendationOptions', [])
+                    if rec_options:
+                        recommendations.append({
+                            'type': 'EC2',
+                            'resource_id': rec.get('instanceArn', '').split('/')[-1],
+                            'finding': rec.get('finding'),
+                            'current': rec.get('currentInstanceType', 'Unknown'),
+                            'recommended': rec_options[0].get('instanceType', 'Unknown'),
+                            'category': 'Compute'
+                        })
+    except Exception as e:
+        return recommendations, _transient_co_error(e)
+    
+    return recommendations, None
+
+
+def _ebs_recommendations(co) -> Tuple[List[Dict], Optional[Exception]]:
+    """Non-optimized EBS volumes from Compute Optimizer, as (recommendations, error)"""
+    recommendations = []
     
     try:
-        if co:
-            ebs_response = co.get_ebs_volume_recommendations()
-            
-            for rec in ebs_response.get('volumeRecommendations', []):
+        for page in _iter_pages(co.get_ebs_volume_recommendations, 'nextToken'):
+            for rec in page.get('volumeRecommendations', []):
                 if rec.get('finding') != 'OPTIMIZED':
                     recommendations.append({
                         'type': 'EBS',
@@ -263,18 +501,38 @@ def fetch_real_recommendations() -> Optional[List[Dict]]:
                         'recommended': rec.get('volumeRecommendationOptions', [{}])[0].get('configuration', {}).get('volumeType'),
                         'category': 'Storage'
                     })
-    except Exception:
-        pass
+    except Exception as e:
+        return recommendations, _transient_co_error(e)
     
-    return recommendations if recommendations else None
+    return recommendations, None
+
+
+def clear_finops_cache():
+    """Drop cached AWS responses so the next render fetches fresh data"""
+    for cached_fetch in (_fetch_real_cost_data, _fetch_monthly_costs, _fetch_real_forecast,
+                         _fetch_real_budgets, _fetch_real_recommendations):
+        cached_fetch.clear()
 
 
 # ============================================================================
 # RENDER FUNCTIONS
 # ============================================================================
 
-def render_real_budget_tracking():
-    """Render budget tracking with REAL AWS data"""
+# Chart layouts are constant per chart type - build them once
+_TREND_LAYOUT = dict(height=350, yaxis_title='Cost ($)',
+                     legend=dict(orientation='h', yanchor='bottom', y=1.02))
+_PIE_LAYOUT = dict(height=350)
+
+# Each view is a fragment: its widgets (refresh, expanders) rerun only that
+# view instead of the whole app script.
+
+@st.fragment
+def render_real_budget_tracking(key_prefix: str = "finops_live"):
+    """
+    Render budget tracking with REAL AWS data.
+    key_prefix keeps widget keys unique when the view is rendered more than
+    once on a page (the live dashboard shows it under two tabs).
+    """
     
     st.subheader("📈 Budget Tracking & Forecasting")
     
@@ -301,14 +559,42 @@ def render_real_budget_tracking():
         st.error("❌ Cost Explorer client not available")
         return
     
-    st.success("✅ Connected to AWS Cost Explorer")
+    col_status, col_refresh = st.columns([4, 1])
+    with col_status:
+        st.success("✅ Connected to AWS Cost Explorer")
+    with col_refresh:
+        if st.button("🔄 Refresh", key=f"{key_prefix}_refresh"):
+            clear_finops_cache()
+    
+    if st.session_state.get('ce_call_count', 0) >= CE_SOFT_CALL_CAP:
+        st.warning(f"⚠️ Cost Explorer soft cap of {CE_SOFT_CALL_CAP} requests reached this month - "
+                   "showing cached data only.")
     
     # Fetch data
     with st.spinner("Loading cost data..."):
-        costs = fetch_real_cost_data(30)
-        forecast = fetch_real_forecast()
-        monthly_costs = fetch_monthly_costs(6)
-        budgets = fetch_real_budgets()
+        results = _fetch_concurrently({
+            'costs': lambda: _load_cost_data(30),
+            'forecast': fetch_real_forecast,
+            'monthly_costs': lambda: _load_monthly_costs(6),
+            'budgets': fetch_real_budgets,
+        }, return_exceptions=True)
+    
+    # Report failures here, on the script thread, so warnings land in this view
+    for key, label in (('costs', 'Cost data'), ('monthly_costs', 'Monthly costs')):
+        if isinstance(results[key], Exception):
+            st.warning(f"{label}: {results[key]}")
+            results[key] = None
+    costs = results['costs']
+    forecast = results['forecast']
+    monthly_costs = results['monthly_costs']
+    budgets = results['budgets']
+    
+    last_fetch = st.session_state.get('ce_last_fetch')
+    st.caption(
+        f"Cost Explorer last queried {last_fetch:%Y-%m-%d %H:%M:%S} · "
+        f"{st.session_state.get('ce_call_count', 0)} billed requests this month (this session)"
+        if last_fetch else "Showing cached Cost Explorer data"
+    )
     
     if not costs:
         st.warning("No cost data available. Cost Explorer may not be enabled or there's no historical data.")
@@ -330,7 +616,7 @@ def render_real_budget_tracking():
             st.metric("Forecast", "N/A")
     with col4:
         if costs['service_costs']:
-            top_service = max(costs['service_costs'], key=costs['service_costs'].get)
+            top_service = max(costs['service_costs'].items(), key=itemgetter(1))[0]
             display_name = top_service[:18] + "..." if len(top_service) > 18 else top_service
             st.metric("Top Service", display_name)
     
@@ -355,6 +641,24 @@ def render_real_budget_tracking():
             st.metric("Forecasted", f"${main_budget['forecasted']:,.0f}")
         with col4:
             st.metric("Remaining", f"${main_budget['remaining']:,.0f}")
+        
+        if len(budgets) > 1:
+            # Build only the displayed columns; numbers are formatted client-side
+            budgets_df = pd.DataFrame.from_records(
+                budgets, columns=['name', 'type', 'limit', 'actual', 'utilization']
+            )
+            st.dataframe(
+                budgets_df,
+                hide_index=True,
+                width="stretch",
+                column_config={
+                    'name': 'Budget',
+                    'type': 'Type',
+                    'limit': st.column_config.NumberColumn('Limit', format='$%.0f'),
+                    'actual': st.column_config.NumberColumn('Spent', format='$%.0f'),
+                    'utilization': st.column_config.NumberColumn('Used', format='%.1f%%'),
+                }
+            )
     else:
         st.info("💡 No AWS Budgets configured. Create a budget in AWS Console for budget tracking.")
     
@@ -363,8 +667,6 @@ def render_real_budget_tracking():
         st.markdown("---")
         st.markdown("### 📈 Monthly Cost Trend")
         
-        import plotly.graph_objects as go
-        
         months = [m['month'] for m in monthly_costs]
         month_costs_values = [m['cost'] for m in monthly_costs]
         
@@ -376,8 +678,7 @@ def render_real_budget_tracking():
             fig.add_trace(go.Scatter(x=months, y=budget_line, name='Budget',
                                     line=dict(color='#dc3545', width=3, dash='dash')))
         
-        fig.update_layout(height=350, yaxis_title='Cost ($)',
-                         legend=dict(orientation='h', yanchor='bottom', y=1.02))
+        fig.update_layout(**_TREND_LAYOUT)
         st.plotly_chart(fig, use_container_width=True)
     
     # Service breakdown
@@ -385,25 +686,37 @@ def render_real_budget_tracking():
         st.markdown("---")
         st.markdown("### 📋 Cost by Service (Top 10)")
         
-        import plotly.express as px
-        
-        sorted_services = sorted(costs['service_costs'].items(), key=lambda x: x[1], reverse=True)[:10]
+        # Only the top 10 are shown: select them without sorting every service,
+        # and build one frame that both the pie and the table slice from
+        top_services = heapq.nlargest(10, costs['service_costs'].items(), key=itemgetter(1))
+        services_df = pd.DataFrame.from_records(top_services, columns=['Service', 'Cost'])
         
         col1, col2 = st.columns(2)
         
         with col1:
-            service_data = [{'Service': s[0][:25], 'Cost': s[1]} for s in sorted_services]
-            df = pd.DataFrame(service_data)
-            fig = px.pie(df, values='Cost', names='Service', hole=0.4)
-            fig.update_layout(height=350)
+            pie_df = services_df.assign(Service=services_df['Service'].str[:25])
+            fig = px.pie(pie_df, values='Cost', names='Service', hole=0.4)
+            fig.update_layout(**_PIE_LAYOUT)
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
-            for service, cost in sorted_services[:7]:
-                pct = (cost / costs['total_cost'] * 100) if costs['total_cost'] > 0 else 0
-                st.write(f"**{service[:30]}**: ${cost:,.2f} ({pct:.1f}%)")
+            # Send raw numbers and let the frontend format them
+            total = costs['total_cost']
+            top_df = services_df.head(7).assign(
+                Share=services_df['Cost'].head(7) / total * 100 if total > 0 else 0.0
+            )
+            st.dataframe(
+                top_df,
+                hide_index=True,
+                width="stretch",
+                column_config={
+                    'Cost': st.column_config.NumberColumn(format='$%.2f'),
+                    'Share': st.column_config.NumberColumn(format='%.1f%%'),
+                }
+            )
 
 
+@st.fragment
 def render_real_optimization_recommendations():
     """Render optimization recommendations"""
     
@@ -448,13 +761,24 @@ def render_real_optimization_recommendations():
     
     st.markdown("---")
     
-    # Recommendations list
-    for i, rec in enumerate(recommendations[:10]):
-        with st.expander(f"**{rec['type']}**: {rec['resource_id'][:20]}..."):
-            st.write(f"**Finding:** {rec.get('finding', 'N/A')}")
-            st.write(f"**Current:** {rec.get('current', 'N/A')}")
-            st.write(f"**Recommended:** {rec.get('recommended', 'N/A')}")
-            st.write(f"**Category:** {rec.get('category', 'N/A')}")
+    # Recommendations list - one virtualized table instead of an expander per resource
+    recs_df = pd.DataFrame.from_records(
+        recommendations,
+        columns=['type', 'resource_id', 'finding', 'current', 'recommended', 'category']
+    )
+    st.dataframe(
+        recs_df,
+        hide_index=True,
+        width="stretch",
+        column_config={
+            'type': 'Type',
+            'resource_id': 'Resource',
+            'finding': 'Finding',
+            'current': 'Current',
+            'recommended': 'Recommended',
+            'category': 'Category',
+        }
+    )
 
 
 def render_live_finops_dashboard():
@@ -476,10 +800,10 @@ def render_live_finops_dashboard():
     tabs = st.tabs(["📊 Cost Dashboard", "📈 Budget Tracking", "🎯 Optimization"])
     
     with tabs[0]:
-        render_real_budget_tracking()
+        render_real_budget_tracking(key_prefix="finops_live_costs")
     
     with tabs[1]:
-        render_real_budget_tracking()
+        render_real_budget_tracking(key_prefix="finops_live_budgets")
     
     with tabs[2]:
         render_real_optimization_recommendations()
@@ -493,5 +817,6 @@ __all__ = [
     'fetch_real_cost_data',
     'fetch_real_budgets',
     'fetch_monthly_costs',
+    'clear_finops_cache',
     'is_live_mode'
 ]
\ No newline at end of file
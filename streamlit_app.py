@@ -1865,6 +1865,19 @@ def get_compliance_data_for_mode():
 # AWS CLIENT INITIALIZATION
 # ============================================================================
 
+def _cost_explorer_client(session):
+    """
+    Cost Explorer client (us-east-1 only). Goes through aws_connector's
+    cached client so the connection pool and retry config are shared across
+    reruns and the parallel Cost Explorer fetches.
+    """
+    if AWS_CONNECTOR_AVAILABLE:
+        client = get_aws_client('ce', session, 'us-east-1')
+        if client:
+            return client
+    return session.client('ce', region_name='us-east-1')
+
+
 # NOTE: Removed @st.cache_resource to ensure credentials are always fresh
 # If you experience slow performance, you can add back: @st.cache_resource(ttl=300)
 def get_aws_clients(access_key: str = None, secret_key: str = None, region: str = None, session_token: str = None):
@@ -1941,7 +1954,7 @@ def get_aws_clients(access_key: str = None, secret_key: str = None, region: str
                     
                     # Cost Explorer (must use us-east-1)
                     try:
-                        clients['ce'] = session.client('ce', region_name='us-east-1')
+                        clients['ce'] = _cost_explorer_client(session)
                         st.session_state.service_status['Cost Explorer'] = 'active'
                         print("✅ Cost Explorer initialized: active")
                     except Exception as e:
@@ -2063,7 +2076,7 @@ def get_aws_clients(access_key: str = None, secret_key: str = None, region: str
         
         # Cost Explorer (must use us-east-1)
         try:
-            clients['ce'] = session.client('ce', region_name='us-east-1')
+            clients['ce'] = _cost_explorer_client(session)
             st.session_state.service_status['Cost Explorer'] = 'active'
         except Exception as e:
             clients['ce'] = None
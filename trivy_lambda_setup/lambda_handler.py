@@ -5,10 +5,167 @@ This Lambda function runs Trivy scans on container images
 and returns vulnerability results via API Gateway.
 """
 
+import base64
 import json
 import subprocess
 import os
-from datetime import datetime
+import re
+import shutil
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Optional DynamoDB result cache. Repeat scans of the same image (by digest
+# where it can be resolved) return the stored response instead of re-running
+# Trivy. Disabled when SCAN_CACHE_TABLE is not set.
+SCAN_CACHE_TABLE = os.environ.get('SCAN_CACHE_TABLE')
+SCAN_CACHE_TTL = int(os.environ.get('SCAN_CACHE_TTL', 86400))  # 24 hours
+DIGEST_TTL = 60  # Seconds a resolved tag -> digest mapping is trusted
+
+ECR_IMAGE_RE = re.compile(
+    r'^(?P<registry>\d{12})\.dkr\.ecr\.(?P<region>[a-z0-9-]+)\.amazonaws\.com/'
+    r'(?P<repo>[^:@]+):(?P<tag>[^:@]+)$'
+)
+
+_cache_table = None
+_ecr_clients = {}
+_client_lock = threading.Lock()  # boto3 client creation is not thread-safe
+_digest_cache = {}  # image -> (digest, resolved_at)
+
+TRIVY_BIN = os.environ.get('TRIVY_BIN', '/usr/local/bin/trivy')
+TRIVY_CACHE_DIR = os.environ.get('TRIVY_CACHE_DIR', '/tmp/trivy-cache')
+SCAN_TIMEOUT = 280  # Lambda timeout minus buffer
+
+# Batch mode limits. Each concurrent Trivy process needs roughly this much
+# memory and /tmp space, so the worker count is capped by the function's
+# MemorySize and free ephemeral storage as well as by CPU count.
+MAX_BATCH_IMAGES = int(os.environ.get('MAX_BATCH_IMAGES', 10))
+BATCH_SCAN_MEMORY_MB = 1024
+BATCH_SCAN_TMP_MB = 1024
+BATCH_DEADLINE_BUFFER = 10  # Seconds kept back to build the response
+BATCH_MIN_SCAN_TIME = 20  # Don't start a scan with less time than this left
+CVSS_SOURCES = ('nvd', 'redhat', 'ghsa')  # In order of preference
+DETAIL_LEVELS = ('full', 'summary')
+VALID_SEVERITIES = frozenset({'CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'UNKNOWN'})
+
+
+@dataclass(slots=True)
+class Vulnerability:
+    """
+    One finding in the response. Slotted - a large image yields thousands of
+    these, and slots are smaller and faster to build than per-record dicts.
+    Serialises to the same JSON object the dicts produced.
+    """
+    cve_id: str
+    package: str
+    installed_version: str
+    fixed_version: str
+    severity: str
+    cvss_score: float
+    description: str
+    layer: str
+    references: list
+
+
+@dataclass(slots=True)
+class VulnerabilitySummary:
+    """Finding without the bulky text fields, for "detail": "summary" requests"""
+    cve_id: str
+    package: str
+    installed_version: str
+    fixed_version: str
+    severity: str
+    cvss_score: float
+
+
+_db_lock = threading.Lock()
+_db_next_update = 0.0  # Epoch seconds the on-disk DB is current until
+_db_last_attempt = 0.0  # Epoch seconds of the last download attempt
+DB_RETRY_INTERVAL = 3600  # Seconds between download attempts, like Trivy's own DownloadedAt guard
+
+
+def _read_db_next_update():
+    """NextUpdate from the DB's metadata.json as epoch seconds; 0 when missing or unreadable"""
+    try:
+        with open(os.path.join(TRIVY_CACHE_DIR, 'db', 'metadata.json')) as f:
+            next_update = json.load(f).get('NextUpdate') or ''
+        # RFC 3339 in UTC, with up to nanosecond precision - seconds are plenty
+        return datetime.strptime(next_update[:19], '%Y-%m-%dT%H:%M:%S').replace(
+            tzinfo=timezone.utc
+        ).timestamp()
+    except (OSError, ValueError, AttributeError):
+        return 0.0
+
+
+def _warm_trivy_db():
+    """
+    Make sure the vulnerability DB on disk is current, downloading it when it
+    is missing or past its NextUpdate. Returns True when scans can safely
+    pass --skip-db-update. Warm and provisioned environments live for hours,
+    so a DB that merely exists is not enough - a stale one would also end up
+    in the result cache.
+    
+    Download attempts are at most DB_RETRY_INTERVAL apart. Until the next
+    one, a failed download (e.g. registry rate limit) or a DB still past
+    its NextUpdate is used as is rather than retried - by us or by Trivy -
+    on every scan. Only with no DB on disk at all do scans fall back to
+    Trivy's own download. Never raises.
+    """
+    global _db_next_update, _db_last_attempt
+    with _db_lock:
+        now = time.time()
+        if now < _db_next_update:
+            return True
+        _db_next_update = _read_db_next_update()
+        if now < _db_next_update:
+            return True
+        if now - _db_last_attempt < DB_RETRY_INTERVAL:
+            return _db_on_disk()
+        _db_last_attempt = now
+        try:
+            subprocess.run(
+                [TRIVY_BIN, 'image', '--download-db-only', '--quiet',
+                 '--cache-dir', TRIVY_CACHE_DIR],
+                capture_output=True,
+                text=True,
+                timeout=60
+            )
+        except Exception as e:
+            print(f"Trivy DB download failed: {e}")
+            return _db_on_disk()
+        _db_next_update = _read_db_next_update()
+        if time.time() >= _db_next_update:
+            print("Trivy DB is still out of date; retrying in an hour")
+        return _db_on_disk()
+
+
+def _db_on_disk():
+    """Whether any vulnerability DB has been downloaded to the cache dir"""
+    return os.path.exists(os.path.join(TRIVY_CACHE_DIR, 'db', 'trivy.db'))
+
+
+# On-demand INIT is capped at 10s, too short for the DB download - it would
+# be cut off and the whole init retried inside the first invoke. Provisioned
+# environments initialise ahead of traffic without that cap, so only they
+# fetch the DB here; on-demand ones fetch it on their first scan.
+if os.environ.get('AWS_LAMBDA_INITIALIZATION_TYPE') == 'provisioned-concurrency':
+    _warm_trivy_db()
 
 
 def handler(event, context):
@@ -19,136 +176,391 @@ def handler(event, context):
     {
         "image": "nginx:latest",
         "severity": "CRITICAL,HIGH,MEDIUM,LOW",  # Optional
-        "ignore_unfixed": false  # Optional
+        "ignore_unfixed": false,  # Optional
+        "detail": "full"  # Optional: "full" (default) or "summary"
     }
+    
+    "detail": "summary" returns only cve_id, package, installed_version,
+    fixed_version, severity and cvss_score per finding, dropping the
+    description, references and layer that make up most of the payload.
+    
+    Batch mode: pass "images": ["nginx:latest", "redis:7", ...] instead of
+    "image" to scan them concurrently (at most MAX_BATCH_IMAGES). The
+    response is {"results": [...]} with one single-image response body per
+    image, in request order.
     """
     try:
-        # Parse request body
-        if isinstance(event.get('body'), str):
-            body = json.loads(event['body'])
-        else:
-            body = event.get('body', {}) or {}
-        
+        body = _parse_body(event)
+    except ValueError as e:
+        return _response(400, {
+            'error': f'Invalid request body: {e}'
+        })
+    
+    try:
         image = body.get('image', 'nginx:latest')
         severity = body.get('severity', 'CRITICAL,HIGH,MEDIUM,LOW')
         ignore_unfixed = body.get('ignore_unfixed', False)
+        detail = body.get('detail', 'full')
         
-        # Build Trivy command
-        cmd = [
-            '/usr/local/bin/trivy',
-            'image',
-            '--format', 'json',
-            '--quiet',
-            '--severity', severity,
-            '--cache-dir', '/tmp/trivy-cache'
-        ]
+        if detail not in DETAIL_LEVELS:
+            return _response(400, {
+                'error': f"detail must be one of: {', '.join(DETAIL_LEVELS)}"
+            })
         
-        if ignore_unfixed:
-            cmd.append('--ignore-unfixed')
+        # Reject unknown severities before paying for a scan, and normalise
+        # casing/spacing so equivalent filters share a cache entry
+        severities = [part.strip().upper() for part in str(severity).split(',')]
+        if not any(severities) or any(part not in VALID_SEVERITIES for part in severities):
+            return _response(400, {
+                'error': f"severity must be a comma-separated list of: {', '.join(sorted(VALID_SEVERITIES))}",
+                'severity': severity
+            })
+        severity = ','.join(severities)
         
-        cmd.append(image)
+        images = body.get('images')
+        if isinstance(images, list) and images:
+            if len(images) > MAX_BATCH_IMAGES:
+                return _response(400, {
+                    'error': f'At most {MAX_BATCH_IMAGES} images per batch request',
+                    'count': len(images)
+                })
+            return scan_batch(images, severity, ignore_unfixed, detail, context)
         
-        # Run Trivy scan
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=280  # Lambda timeout minus buffer
-        )
+        return cached_scan(image, severity, ignore_unfixed, detail)
         
-        if result.returncode != 0 and not result.stdout:
-            return {
-                'statusCode': 500,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': f'Trivy scan failed: {result.stderr}',
-                    'image': image
-                })
-            }
+    except subprocess.TimeoutExpired:
+        return _response(504, {
+            'error': 'Scan timed out. Try a smaller image or increase Lambda timeout.',
+            'image': body.get('image', 'unknown')
+        })
+    except Exception as e:
+        return _response(500, {
+            'error': str(e)
+        })
+
+
+def scan_batch(images, severity, ignore_unfixed, detail='full', context=None):
+    """
+    Scan several images concurrently. Trivy runs as a child process, so the
+    worker threads just wait on it. Workers use Trivy's in-memory layer cache
+    so parallel scans don't contend for the filesystem cache's lock, and only
+    read the vulnerability DB refreshed up front.
+    
+    Scans share the invocation's deadline: each is given at most the time
+    left, and images that can't start before it are returned as skipped
+    instead of the whole batch timing out.
+    """
+    # Refresh once up front rather than letting every worker race to download it
+    _warm_trivy_db()
+    
+    def _scan_one(image):
+        timeout = SCAN_TIMEOUT
+        if context is not None:
+            remaining = context.get_remaining_time_in_millis() / 1000 - BATCH_DEADLINE_BUFFER
+            if remaining < BATCH_MIN_SCAN_TIME:
+                return _dumps({'error': 'Skipped: not enough time left in this request.',
+                               'image': image, 'skipped': True})
+            timeout = min(timeout, int(remaining))
+        try:
+            return cached_scan(image, severity, ignore_unfixed, detail,
+                               cache_backend='memory', timeout=timeout)['body']
+        except subprocess.TimeoutExpired:
+            return _dumps({'error': 'Scan timed out.', 'image': image})
+        except Exception as e:
+            return _dumps({'error': str(e), 'image': image})
+    
+    with ThreadPoolExecutor(max_workers=_batch_workers(len(images))) as executor:
+        bodies = list(executor.map(_scan_one, images))
+    
+    # Each body is already encoded JSON - splice rather than decode/re-encode
+    return _response(200, '{"results": [' + ', '.join(bodies) + ']}')
+
+
+def _batch_workers(count):
+    """Concurrent scans the function's CPU, memory and free /tmp space can hold"""
+    memory_mb = int(os.environ.get('AWS_LAMBDA_FUNCTION_MEMORY_SIZE', 0))
+    free_tmp_mb = shutil.disk_usage(tempfile.gettempdir()).free // (1024 * 1024)
+    
+    limits = [count, os.cpu_count() or 2, free_tmp_mb // BATCH_SCAN_TMP_MB]
+    if memory_mb:
+        limits.append(memory_mb // BATCH_SCAN_MEMORY_MB)
+    return max(1, min(limits))
+
+
+def cached_scan(image, severity, ignore_unfixed, detail='full', cache_backend='fs',
+                timeout=SCAN_TIMEOUT):
+    """
+    Run scan_image, reusing a stored response for the same image, severity
+    filter, ignore_unfixed flag and detail level while it is within
+    SCAN_CACHE_TTL.
+    Cache errors are logged and never fail the scan.
+    """
+    table = _get_cache_table()
+    if table is None:
+        return scan_image(image, severity, ignore_unfixed, detail, cache_backend, timeout)
+    
+    key = f"{resolve_image_key(image)}|{severity}|{int(bool(ignore_unfixed))}|{detail}"
+    
+    try:
+        item = table.get_item(Key={'scan_key': key}).get('Item')
+        # DynamoDB TTL deletion is lazy, so check expiry ourselves too
+        if item and int(item.get('expires_at', 0)) > time.time():
+            return _response(200, zlib.decompress(bytes(item['body'])).decode('utf-8'))
+    except Exception as e:
+        print(f"Scan cache read failed: {e}")
+    
+    result = scan_image(image, severity, ignore_unfixed, detail, cache_backend, timeout)
+    
+    if result['statusCode'] == 200:
+        try:
+            # Stored compressed - DynamoDB items are capped at 400KB
+            table.put_item(Item={
+                'scan_key': key,
+                'body': zlib.compress(result['body'].encode('utf-8')),
+                'expires_at': int(time.time()) + SCAN_CACHE_TTL
+            })
+        except Exception as e:
+            print(f"Scan cache write failed: {e}")
+    
+    return result
+
+
+def scan_image(image, severity, ignore_unfixed, detail='full', cache_backend='fs',
+               timeout=SCAN_TIMEOUT):
+    """Run Trivy against a single image and build the API response"""
+    # Build Trivy command
+    cmd = [
+        TRIVY_BIN,
+        'image',
+        '--format', 'json',
+        '--quiet',
+        '--severity', severity,
+        '--cache-dir', TRIVY_CACHE_DIR,
+        '--cache-backend', cache_backend
+    ]
+    
+    # Only skip Trivy's own update check while the local DB is still current
+    if _warm_trivy_db():
+        cmd.append('--skip-db-update')
+    
+    if ignore_unfixed:
+        cmd.append('--ignore-unfixed')
+    
+    cmd.append(image)
+    
+    # Run Trivy scan, parsing its JSON off the pipe as it is written rather
+    # than buffering the whole document and then decoding it
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
         
-        # Parse Trivy output
-        trivy_output = json.loads(result.stdout) if result.stdout else {}
+        timed_out = threading.Event()
         
-        # Transform to standard format
-        vulnerabilities = []
-        for target in trivy_output.get('Results', []):
-            for vuln in target.get('Vulnerabilities', []):
-                vulnerabilities.append({
-                    'cve_id': vuln.get('VulnerabilityID', 'N/A'),
-                    'package': vuln.get('PkgName', 'Unknown'),
-                    'installed_version': vuln.get('InstalledVersion', 'Unknown'),
-                    'fixed_version': vuln.get('FixedVersion', 'No fix available'),
-                    'severity': vuln.get('Severity', 'UNKNOWN'),
-                    'cvss_score': extract_cvss_score(vuln),
-                    'description': vuln.get('Description', '')[:500],
-                    'layer': target.get('Target', 'Unknown'),
-                    'references': vuln.get('References', [])[:3]
-                })
+        def _kill_scan():
+            timed_out.set()
+            proc.kill()
         
-        # Calculate summary
-        summary = {
-            'total': len(vulnerabilities),
-            'critical': sum(1 for v in vulnerabilities if v['severity'] == 'CRITICAL'),
-            'high': sum(1 for v in vulnerabilities if v['severity'] == 'HIGH'),
-            'medium': sum(1 for v in vulnerabilities if v['severity'] == 'MEDIUM'),
-            'low': sum(1 for v in vulnerabilities if v['severity'] == 'LOW')
-        }
+        timer = threading.Timer(timeout, _kill_scan)
+        timer.start()
         
-        response = {
-            'scanner': 'Trivy (Lambda)',
-            'image': image,
-            'scan_time': datetime.now().isoformat(),
-            'vulnerabilities': vulnerabilities,
-            'summary': summary,
-            'live_data': True,
-            'trivy_version': get_trivy_version()
-        }
+        # Transform to standard format, tallying severities in the same pass
+        summary_only = detail == 'summary'
+        vulnerabilities = []
+        severity_counts = Counter()
+        parse_error = None
+        has_output = False
+        try:
+            has_output = bool(proc.stdout.peek(1))
+            for target in (_iter_results(proc.stdout) if has_output else ()):
+                for vuln in target.get('Vulnerabilities') or []:
+                    vuln_severity = vuln.get('Severity', 'UNKNOWN')
+                    severity_counts[vuln_severity] += 1
+                    if summary_only:
+                        vulnerabilities.append(VulnerabilitySummary(
+                            cve_id=vuln.get('VulnerabilityID', 'N/A'),
+                            package=vuln.get('PkgName', 'Unknown'),
+                            installed_version=vuln.get('InstalledVersion', 'Unknown'),
+                            fixed_version=vuln.get('FixedVersion', 'No fix available'),
+                            severity=vuln_severity,
+                            cvss_score=extract_cvss_score(vuln)
+                        ))
+                    else:
+                        vulnerabilities.append(Vulnerability(
+                            cve_id=vuln.get('VulnerabilityID', 'N/A'),
+                            package=vuln.get('PkgName', 'Unknown'),
+                            installed_version=vuln.get('InstalledVersion', 'Unknown'),
+                            fixed_version=vuln.get('FixedVersion', 'No fix available'),
+                            severity=vuln_severity,
+                            cvss_score=extract_cvss_score(vuln),
+                            description=vuln.get('Description', '')[:500],
+                            layer=target.get('Target', 'Unknown'),
+                            references=vuln.get('References', [])[:3]
+                        ))
+        except Exception as e:
+            parse_error = e
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+            returncode = proc.wait()
         
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps(response)
-        }
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
         
-    except subprocess.TimeoutExpired:
-        return {
-            'statusCode': 504,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'error': 'Scan timed out. Try a smaller image or increase Lambda timeout.',
-                'image': body.get('image', 'unknown')
+        if returncode != 0 and (parse_error or not has_output):
+            stderr_file.seek(0)
+            return _response(500, {
+                'error': f"Trivy scan failed: {stderr_file.read().decode('utf-8', 'replace')}",
+                'image': image
             })
-        }
+        if parse_error:
+            raise parse_error
+    
+    # Calculate summary
+    summary = {
+        'total': len(vulnerabilities),
+        'critical': severity_counts['CRITICAL'],
+        'high': severity_counts['HIGH'],
+        'medium': severity_counts['MEDIUM'],
+        'low': severity_counts['LOW']
+    }
+    
+    response = {
+        'scanner': 'Trivy (Lambda)',
+        'image': image,
+        'scan_time': datetime.now(timezone.utc),
+        'vulnerabilities': vulnerabilities,
+        'summary': summary,
+        'live_data': True,
+        'trivy_version': TRIVY_VERSION
+    }
+    
+    return _response(200, response)
+
+
+def _iter_results(stream):
+    """
+    Yield Trivy's per-target Results entries from its JSON output stream.
+    With ijson each target is decoded as it arrives, so the full report is
+    never held in memory at once; without it, fall back to json.load.
+    """
+    if ijson is None:
+        yield from (json.load(stream) or {}).get('Results') or []
+    else:
+        yield from ijson.items(stream, 'Results.item', use_float=True)
+
+
+def resolve_image_key(image):
+    """
+    Cache key for an image reference. Digest-pinned references are used as
+    is; ECR tags are resolved to their current digest (memoized for
+    DIGEST_TTL seconds) so a re-pushed tag is never served a stale result.
+    Other tags fall back to the reference itself, bounded by SCAN_CACHE_TTL.
+    """
+    if '@sha256:' in image:
+        return image
+    
+    match = ECR_IMAGE_RE.match(image)
+    if not match:
+        return image
+    
+    cached = _digest_cache.get(image)
+    if cached and time.time() - cached[1] < DIGEST_TTL:
+        return cached[0]
+    
+    try:
+        region = match.group('region')
+        with _client_lock:
+            if region not in _ecr_clients:
+                import boto3
+                _ecr_clients[region] = boto3.client('ecr', region_name=region)
+        
+        images = _ecr_clients[region].batch_get_image(
+            registryId=match.group('registry'),
+            repositoryName=match.group('repo'),
+            imageIds=[{'imageTag': match.group('tag')}]
+        ).get('images', [])
+        if not images:
+            return image
+        
+        key = f"{image.rsplit(':', 1)[0]}@{images[0]['imageId']['imageDigest']}"
+        _digest_cache[image] = (key, time.time())
+        return key
     except Exception as e:
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'error': str(e)
-            })
-        }
+        print(f"Digest lookup failed for {image}: {e}")
+        return image
+
+
+def _parse_body(event):
+    """
+    Request body as a dict. API Gateway delivers a JSON string (base64 when
+    isBase64Encoded is set); direct invocations may pass a dict. Raises
+    ValueError for anything that isn't a JSON object.
+    """
+    raw = event.get('body')
+    if isinstance(raw, (str, bytes)):
+        if event.get('isBase64Encoded'):
+            raw = base64.b64decode(raw)
+        # orjson.JSONDecodeError subclasses ValueError, as json's does
+        body = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    else:
+        body = raw or {}
+    
+    if not isinstance(body, dict):
+        raise ValueError('expected a JSON object')
+    return body
+
+
+def _get_cache_table():
+    """DynamoDB scan cache table, created once per container (batch workers call this concurrently)"""
+    global _cache_table
+    if _cache_table is None and SCAN_CACHE_TABLE:
+        with _client_lock:
+            if _cache_table is None:
+                import boto3
+                _cache_table = boto3.resource('dynamodb').Table(SCAN_CACHE_TABLE)
+    return _cache_table
+
+
+def _response(status_code, body):
+    """API Gateway proxy response; body is a dict or an already-encoded JSON string"""
+    return {
+        'statusCode': status_code,
+        'headers': {
+            'Content-Type': 'application/json',
+            'Access-Control-Allow-Origin': '*'
+        },
+        'body': body if isinstance(body, str) else _dumps(body)
+    }
+
+
+def _dumps(obj):
+    """Encode to a JSON string, using orjson (much faster on large reports) when installed"""
+    if orjson is not None:
+        # orjson serialises dataclasses and datetimes (RFC 3339) natively
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, default=_json_default)
+
+
+def _json_default(obj):
+    """json.dumps fallback for the types orjson handles natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return asdict(obj)
 
 
 def extract_cvss_score(vuln):
     """Extract CVSS score from vulnerability data"""
-    cvss = vuln.get('CVSS', {})
+    cvss = vuln.get('CVSS') or {}
     
-    # Try NVD first, then others
-    for source in ['nvd', 'redhat', 'ghsa']:
-        if source in cvss:
-            return cvss[source].get('V3Score', cvss[source].get('V2Score', 0))
+    # Try NVD first, then others - V3 before V2, first score found wins
+    for source in CVSS_SOURCES:
+        entry = cvss.get(source)
+        if entry:
+            score = entry.get('V3Score')
+            if score is not None:
+                return score
+            score = entry.get('V2Score')
+            if score is not None:
+                return score
     
     return 0
 
@@ -157,7 +569,7 @@ def get_trivy_version():
     """Get installed Trivy version"""
     try:
         result = subprocess.run(
-            ['/usr/local/bin/trivy', '--version'],
+            [TRIVY_BIN, '--version'],
             capture_output=True,
             text=True,
             timeout=10
@@ -167,6 +579,10 @@ def get_trivy_version():
         return 'Unknown'
 
 
+# The binary can't change within a container - resolve its version once at init
+TRIVY_VERSION = get_trivy_version()
+
+
 # For local testing
 if __name__ == '__main__':
     test_event = {